@@ -0,0 +1,138 @@
+"""
+Check that `FastPathRouter` answers exactly like Starlette's `Router`.
+
+Run: `python scripts/check_fastpath.py` (needs `httpx` for `TestClient`).
+"""
+
+import sys
+from pathlib import Path
+
+from starlette.applications import Starlette
+from starlette.endpoints import HTTPEndpoint
+from starlette.exceptions import HTTPException
+from starlette.responses import JSONResponse, PlainTextResponse
+from starlette.routing import Mount, Route, Router
+from starlette.testclient import TestClient
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1] / "src"))
+
+from zeon import FastPathRouter  # pylint: disable=C0413,E0401
+
+
+async def params(request):
+    """
+    Echo the endpoint's path params.
+    """
+    return JSONResponse(request.path_params)
+
+
+async def forbidden(request):
+    """
+    Handled by `ExceptionMiddleware`.
+    """
+    raise HTTPException(403)
+
+
+async def teapot(request):
+    """
+    Handled by a custom status handler.
+    """
+    raise HTTPException(418)
+
+
+async def second(request):
+    """
+    Shadowed by the `HTTPEndpoint` registered before it.
+    """
+    return PlainTextResponse("second")
+
+
+class First(HTTPEndpoint):
+    """
+    `Route.methods` is `None`: matches every method.
+    """
+
+    async def get(self, request):
+        """
+        GET handler.
+        """
+        return PlainTextResponse("first")
+
+    async def post(self, request):
+        """
+        POST handler.
+        """
+        return PlainTextResponse("first")
+
+
+def build(router_class):
+    """
+    Same routes and handlers, with `router_class` as the app's router.
+    """
+    app = Starlette(
+        exception_handlers={418: lambda request, exc: PlainTextResponse("tea", 418)}
+    )
+    app.router = router_class(
+        routes=[
+            Route("/", params),
+            Route("/items", params, methods=["GET", "POST"]),
+            Route("/forbidden", forbidden),
+            Route("/teapot", teapot),
+            Route("/x", First),
+            Route("/x", second, methods=["POST"]),
+            Route("/after", params),
+            Mount("/u/{uid}", app=router_class(routes=[Route("/info", params)])),
+        ]
+    )
+    return app
+
+
+REQUESTS = [
+    ("GET", "/"),
+    ("HEAD", "/"),
+    ("POST", "/"),  # 405
+    ("GET", "/items"),
+    ("POST", "/items"),
+    ("DELETE", "/items"),  # 405
+    ("GET", "/items/"),  # Slash redirect
+    ("GET", "/forbidden"),
+    ("GET", "/teapot"),
+    ("GET", "/x"),
+    ("POST", "/x"),
+    ("GET", "/after"),
+    ("GET", "/u/7/info"),
+    ("HEAD", "/u/7/info"),
+    ("GET", "/u/7/info/"),  # Slash redirect inside a `Mount`
+    ("GET", "/missing"),
+]
+
+
+def snapshot(client, method, path):
+    """
+    The parts of a response that must not differ between routers.
+    """
+    response = client.request(method, path, follow_redirects=False)
+    headers = {key: response.headers.get(key) for key in ("allow", "location")}
+    return response.status_code, response.content, headers
+
+
+def main():
+    """
+    Compare every request (plain and under a `root_path`) across both routers.
+    """
+    fast = build(FastPathRouter)
+    assert ("GET", "/items") in fast.router.static
+    assert ("GET", "/after") not in fast.router.static  # Behind the `HTTPEndpoint`
+
+    for root_path in ("", "/api"):
+        expected = TestClient(build(Router), root_path=root_path)
+        actual = TestClient(fast, root_path=root_path)
+        for method, path in REQUESTS:
+            want = snapshot(expected, method, root_path + path)
+            got = snapshot(actual, method, root_path + path)
+            assert got == want, f"{method} {root_path}{path}: {got} != {want}"
+            print(f"ok  {want[0]}  {method:<6} {root_path}{path}")
+
+
+if __name__ == "__main__":
+    main()
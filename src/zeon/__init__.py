@@ -3,24 +3,83 @@ import contextlib
 import logging
 
 from starlette.applications import Starlette
-from starlette.background import BackgroundTask
-from starlette.responses import HTMLResponse, JSONResponse
-from starlette.routing import Route, WebSocketRoute
+from starlette.responses import JSONResponse, Response
+from starlette.routing import Route, Router, WebSocketRoute
 from starlette.websockets import WebSocket, WebSocketDisconnect
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None  # type: ignore[assignment]
+
+# Logging (handlers are configured by the application entrypoint)
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Pre-Encoded Bodies
+_HEALTH_JSON = b'{"status":"ok"}'
+_HELLO_HTML = b"<html><body style='background:black; color: white;'><h1>Hello, world!</h1></body></html>"
 
 
-async def get_client_ip(request):
+class ORJSONResponse(JSONResponse):
     """
-    Retrieve the client's IP address from the request.
+    JSON Response rendered with `orjson` (falls back to stdlib `json`).
+    """
+
+    def render(self, content) -> bytes:
+        if orjson is None:
+            return super().render(content)
+        return orjson.dumps(content)
+
+
+def _route_path(scope) -> str:
+    """
+    Request path relative to `root_path` (same rules as Starlette's router).
+    """
+    path, root_path = scope["path"], scope.get("root_path", "")
+    if not root_path or not path.startswith(root_path):
+        return path
+    if path == root_path:
+        return ""
+    if path[len(root_path)] == "/":
+        return path[len(root_path) :]
+    return path
+
+
+class FastPathRouter(Router):
+    """
+    Router with an exact `(method, path)` lookup for static HTTP routes.
+
+    The lookup is built from the leading plain `Route`s with explicit `methods` and no
+    path parameters, so Starlette's first-match order is kept. Everything else (dynamic
+    paths, `Mount`s, unknown methods, `websocket`/`lifespan`) goes through `Router.app`.
     """
-    client_host = request.client.host  # Get the IP address from the client's connection
-    forwarded_for = request.headers.get("x-forwarded-for")  # Check for proxy headers
-    ip_address = forwarded_for.split(",")[0] if forwarded_for else client_host
-    return ip_address
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.static = {}
+        for route in self.routes:
+            if isinstance(route, WebSocketRoute):
+                continue  # Never matches `http` scopes
+            # Subclasses may override `matches`; dynamic paths and routes without
+            # `methods` (`HTTPEndpoint`s, ASGI apps) match more than one key
+            plain = type(route) is Route  # pylint: disable=C0123
+            if not plain or route.methods is None or route.param_convertors:
+                break
+            for method in route.methods:
+                self.static.setdefault((method, route.path), route)
+
+    async def app(self, scope, receive, send):
+        if scope["type"] == "http":
+            route = self.static.get((scope["method"], _route_path(scope)))
+            if route is not None:
+                scope.setdefault("router", self)
+                # As in `Route.matches`: keep params from an enclosing `Mount`
+                path_params = dict(scope.get("path_params", {}))
+                scope.update(endpoint=route.endpoint, path_params=path_params)
+                await route.handle(scope, receive, send)
+                return
+        await super().app(scope, receive, send)
 
 
 # Internal: Whoami
@@ -28,9 +87,22 @@ async def client_whoami(request):
     """
     Client's IP/Auth.
     """
-    client_ip = await get_client_ip(request)
+    forwarded_for = request.headers.get("x-forwarded-for")  # Check for proxy headers
+    if forwarded_for:
+        client_ip = forwarded_for.split(",", 1)[0]
+    else:
+        # Get the IP address from the client's connection
+        client_ip = request.client.host
     token_value = request.cookies.get("jwtoken", "user_id@domain_name.com")
-    return JSONResponse({"whoami": client_ip, "token": token_value})
+    return ORJSONResponse({"whoami": client_ip, "token": token_value})
+
+
+# Internal: Health-Check
+async def health_check(request):
+    """
+    Service Status.
+    """
+    return Response(_HEALTH_JSON, media_type="application/json")
 
 
 # Internal Task (Background Daemons)
@@ -38,10 +110,23 @@ async def send_welcome_email(to_address: str):
     """
     Simulate Task.
     """
-    logger.info(f"Sending welcome email to {to_address}...")
+    logger.info("Sending welcome email to %s...", to_address)
     # Replace with actual email sending logic
     await asyncio.sleep(1)
-    logger.info(f"Welcome email sent to {to_address}!")
+    logger.info("Welcome email sent to %s!", to_address)
+
+
+# Running Tasks (strong references until done; drained by `lifespan`)
+_BACKGROUND_TASKS: set[asyncio.Task] = set()
+
+
+def _background_done(task: asyncio.Task):
+    """
+    Release a finished task and log its failure.
+    """
+    _BACKGROUND_TASKS.discard(task)
+    if not task.cancelled() and task.exception() is not None:
+        logger.error("Background task failed.", exc_info=task.exception())
 
 
 # Route: HTTP endpoint
@@ -49,11 +134,10 @@ async def http_endpoint(request):
     """
     Handle HTTP Requests.
     """
-    task = BackgroundTask(send_welcome_email, to_address="user_email@example.com")
-    response = HTMLResponse(
-        "<html><body style='background:black; color: white;'><h1>Hello, world!</h1></body></html>",
-        background=task,
-    )
+    task = asyncio.create_task(send_welcome_email(to_address="user_email@example.com"))
+    _BACKGROUND_TASKS.add(task)
+    task.add_done_callback(_background_done)
+    response = Response(_HELLO_HTML, media_type="text/html")
     return response
 
 
@@ -64,36 +148,37 @@ async def webs_endpoint(websocket: WebSocket):
     """
     await websocket.accept()
     try:
-        logger.info("WebSocket connection established.")
         await websocket.send_text("Hello, WebSocket!")
     except WebSocketDisconnect:
-        logger.info("WebSocket connection closed.")
-    except Exception as e:
-        logger.error(f"Error in WebSocket communication: {e}")
-    finally:
-        await websocket.close()
+        logger.debug("WebSocket connection closed by client.")
+        return
+    await websocket.close()
 
 
 # Application Lifespan
 @contextlib.asynccontextmanager
 async def lifespan(app):
     """
-    Context manager to define startup and shutdown events.
+    Context manager to define startup and shutdown events (runs once per worker).
     """
     logger.info("Application is starting up!")
     yield
+    # Failures are logged by `_background_done`
+    await asyncio.gather(*_BACKGROUND_TASKS, return_exceptions=True)
     logger.info("Application is shutting down!")
 
 
 # Application Instance
-app = Starlette(
+app = Starlette()
+# Deliberately replaces the default `Router` built by `Starlette()`
+app.router = FastPathRouter(
     lifespan=lifespan,
     routes=[
         Route("/", http_endpoint),  # HTTP endpoint
         WebSocketRoute("/ws", webs_endpoint),  # WebSocket endpoint
         # System: Who-Am-I & Health-Check
         Route("/whoami", client_whoami),
-        Route("/health", lambda request: JSONResponse({"status": "ok"})),
+        Route("/health", health_check),
     ],
 )
 """
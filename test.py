@@ -1,10 +1,26 @@
+import copy
+import os
+import sys
+
 import uvicorn
+from uvicorn.config import LOGGING_CONFIG
 
 
 HOST = "0.0.0.0"
 PORT = 8000
-LOOP = "auto"  # uvloop
+LOOP = "uvloop" if sys.platform != "win32" else "asyncio"  # libuv (no Windows)
+HTTP = "httptools"  # llhttp
+WS = "websockets"
 RELOAD = True  # For auto-reloading in development
+WORKERS = 1 if RELOAD else (os.cpu_count() or 1)  # `reload` is single-process
+
+# Logging: uvicorn's defaults + the `zeon` logger
+LOG_CONFIG = copy.deepcopy(LOGGING_CONFIG)
+LOG_CONFIG["loggers"]["zeon"] = {
+    "handlers": ["default"],
+    "level": "INFO",
+    "propagate": False,
+}
 
 
 def start_app():
@@ -13,8 +29,11 @@ def start_app():
         host=HOST,
         port=PORT,
         reload=RELOAD,
-        loop="auto",
-        workers=1,
+        loop=LOOP,
+        http=HTTP,
+        ws=WS,
+        workers=WORKERS,
+        log_config=LOG_CONFIG,
     )
 
 